@@ -69,6 +69,71 @@ class DuckDBSaver(BaseDuckDBSaver):
                 cur.execute(migration)
                 cur.execute("INSERT INTO checkpoint_migrations (v) VALUES (?)", [v])
 
+    # defined before `list` so that `list[...]` in its signature is the builtin
+    def put_many(
+        self,
+        items: Sequence[
+            tuple[RunnableConfig, Checkpoint, CheckpointMetadata, ChannelVersions]
+        ],
+    ) -> list[RunnableConfig]:
+        """Save multiple checkpoints to the database in a single transaction.
+
+        If any checkpoint fails to save, none of them are saved.
+
+        Args:
+            items (Sequence[Tuple[RunnableConfig, Checkpoint, CheckpointMetadata, ChannelVersions]]):
+                The (config, checkpoint, metadata, new_versions) arguments for each checkpoint,
+                with the same meaning as in `put`.
+
+        Returns:
+            list[RunnableConfig]: Updated configurations after storing the checkpoints, in input order.
+        """
+        next_configs: list[RunnableConfig] = []
+        checkpoint_blobs: list[tuple[str, str, str, str, str, Optional[bytes]]] = []
+        checkpoint_rows: list[tuple[str, str, str, Optional[str], Any, str]] = []
+        for config, checkpoint, metadata, new_versions in items:
+            configurable = config["configurable"].copy()
+            thread_id = configurable.pop("thread_id")
+            checkpoint_ns = configurable.pop("checkpoint_ns")
+            checkpoint_id = configurable.pop(
+                "checkpoint_id", configurable.pop("thread_ts", None)
+            )
+
+            copy = checkpoint.copy()
+            next_configs.append(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": checkpoint["id"],
+                    }
+                }
+            )
+            checkpoint_blobs.extend(
+                self._dump_blobs(
+                    thread_id,
+                    checkpoint_ns,
+                    copy.pop("channel_values"),  # type: ignore[misc]
+                    new_versions,
+                )
+            )
+            checkpoint_rows.append(
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint["id"],
+                    checkpoint_id,
+                    self._dump_checkpoint(copy),
+                    self._dump_metadata(metadata),
+                )
+            )
+        with self._cursor(transaction=True) as cur:
+            if checkpoint_blobs:
+                cur.executemany(self.UPSERT_CHECKPOINT_BLOBS_SQL, checkpoint_blobs)
+            if checkpoint_rows:
+                cur.executemany(self.UPSERT_CHECKPOINTS_SQL, checkpoint_rows)
+        return next_configs
+
     def list(
         self,
         config: Optional[RunnableConfig],
@@ -278,42 +343,7 @@ class DuckDBSaver(BaseDuckDBSaver):
             >>> print(saved_config)
             {'configurable': {'thread_id': '1', 'checkpoint_ns': '', 'checkpoint_id': '1ef4f797-8335-6428-8001-8a1503f9b875'}}
         """
-        configurable = config["configurable"].copy()
-        thread_id = configurable.pop("thread_id")
-        checkpoint_ns = configurable.pop("checkpoint_ns")
-        checkpoint_id = configurable.pop(
-            "checkpoint_id", configurable.pop("thread_ts", None)
-        )
-
-        copy = checkpoint.copy()
-        next_config = {
-            "configurable": {
-                "thread_id": thread_id,
-                "checkpoint_ns": checkpoint_ns,
-                "checkpoint_id": checkpoint["id"],
-            }
-        }
-        checkpoint_blobs = self._dump_blobs(
-            thread_id,
-            checkpoint_ns,
-            copy.pop("channel_values"),  # type: ignore[misc]
-            new_versions,
-        )
-        with self._cursor() as cur:
-            if checkpoint_blobs:
-                cur.executemany(self.UPSERT_CHECKPOINT_BLOBS_SQL, checkpoint_blobs)
-            cur.execute(
-                self.UPSERT_CHECKPOINTS_SQL,
-                (
-                    thread_id,
-                    checkpoint_ns,
-                    checkpoint["id"],
-                    checkpoint_id,
-                    self._dump_checkpoint(copy),
-                    self._dump_metadata(metadata),
-                ),
-            )
-        return next_config
+        return self.put_many([(config, checkpoint, metadata, new_versions)])[0]
 
     def put_writes(
         self,
@@ -348,9 +378,27 @@ class DuckDBSaver(BaseDuckDBSaver):
             )
 
     @contextmanager
-    def _cursor(self) -> Iterator[duckdb.DuckDBPyConnection]:
+    def _cursor(
+        self, *, transaction: bool = False
+    ) -> Iterator[duckdb.DuckDBPyConnection]:
+        """Create a database cursor as a context manager.
+
+        Args:
+            transaction (bool): whether to run the DB operations inside the context manager
+                in a single transaction, committed on exit and rolled back on error.
+        """
         with self.lock, self.conn.cursor() as cur:
-            yield cur
+            if not transaction:
+                yield cur
+                return
+            cur.begin()
+            try:
+                yield cur
+            except BaseException:
+                cur.rollback()
+                raise
+            else:
+                cur.commit()
 
 
 __all__ = ["DuckDBSaver", "Conn"]
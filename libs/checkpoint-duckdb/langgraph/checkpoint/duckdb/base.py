@@ -2,6 +2,7 @@ import json
 import random
 from typing import Any, List, Optional, Sequence, Tuple, cast
 
+import orjson
 from langchain_core.runnables import RunnableConfig
 
 from langgraph.checkpoint.base import (
@@ -100,9 +101,11 @@ UPSERT_CHECKPOINT_BLOBS_SQL = """
     ON CONFLICT (thread_id, checkpoint_ns, channel, version) DO NOTHING
 """
 
+# NOTE: metadata is serialized with a JSON serializer (not msgpack), so null characters
+# are escaped as \u0000 and need to be removed before writing
 UPSERT_CHECKPOINTS_SQL = """
     INSERT INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, checkpoint, metadata)
-    VALUES (?, ?, ?, ?, ?, ?)
+    VALUES (?, ?, ?, ?, ?, replace(?::VARCHAR, '\\u0000', '')::JSON)
     ON CONFLICT (thread_id, checkpoint_ns, checkpoint_id)
     DO UPDATE SET
         checkpoint = EXCLUDED.checkpoint,
@@ -141,7 +144,7 @@ class BaseDuckDBSaver(BaseCheckpointSaver[str]):
         channel_values: list[tuple[bytes, bytes, bytes]],
         pending_sends: list[tuple[bytes, bytes]],
     ) -> Checkpoint:
-        checkpoint = json.loads(checkpoint_json_str)
+        checkpoint = orjson.loads(checkpoint_json_str)
         return {
             **checkpoint,
             "pending_sends": [
@@ -230,9 +233,8 @@ class BaseDuckDBSaver(BaseCheckpointSaver[str]):
         return self.jsonplus_serde.loads(metadata_json_str.encode())
 
     def _dump_metadata(self, metadata: CheckpointMetadata) -> str:
-        serialized_metadata = self.jsonplus_serde.dumps(metadata)
-        # NOTE: we're using JSON serializer (not msgpack), so we need to remove null characters before writing
-        return serialized_metadata.decode().replace("\\u0000", "")
+        # null characters are removed by UPSERT_CHECKPOINTS_SQL
+        return self.jsonplus_serde.dumps(metadata).decode()
 
     def get_next_version(self, current: Optional[str], channel: ChannelProtocol) -> str:
         if current is None:
@@ -276,8 +278,15 @@ class BaseDuckDBSaver(BaseCheckpointSaver[str]):
 
         # construct predicate for metadata filter
         if filter:
-            wheres.append("json_contains(metadata, ?)")
-            param_values.append(json.dumps(filter))
+            for query_key, query_value in filter.items():
+                if isinstance(query_value, (dict, list)):
+                    # nested values keep containment semantics
+                    wheres.append("json_contains(json_extract(metadata, ?), ?)")
+                else:
+                    wheres.append("json_extract(metadata, ?) = json(?)")
+                param_values.extend(
+                    (_json_key_path(query_key), _dumps_filter_value(query_value))
+                )
 
         # construct predicate for `before`
         if before is not None:
@@ -288,3 +297,17 @@ class BaseDuckDBSaver(BaseCheckpointSaver[str]):
             "WHERE " + " AND ".join(wheres) if wheres else "",
             param_values,
         )
+
+
+def _json_key_path(key: str) -> str:
+    # quote the key so that dots in it aren't read as nested path segments
+    escaped = key.replace("\\", "\\\\").replace('"', '\\"')
+    return f'$."{escaped}"'
+
+
+def _dumps_filter_value(value: Any) -> str:
+    try:
+        return orjson.dumps(value).decode()
+    except orjson.JSONEncodeError:
+        # orjson rejects integers outside the 64-bit range, json does not
+        return json.dumps(value)
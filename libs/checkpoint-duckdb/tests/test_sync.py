@@ -1,24 +1,56 @@
-from typing import Any
+from typing import Any, Iterator
 
+import duckdb
 import pytest
 from langchain_core.runnables import RunnableConfig
 
 from langgraph.checkpoint.base import (
     Checkpoint,
     CheckpointMetadata,
+    CheckpointTuple,
     create_checkpoint,
     empty_checkpoint,
 )
 from langgraph.checkpoint.duckdb import DuckDBSaver
 
+# checkpoints and metadata are only read by the tests, so build them once
+CHKPNT_1: Checkpoint = empty_checkpoint()
+CHKPNT_2: Checkpoint = create_checkpoint(CHKPNT_1, {}, 1)
+CHKPNT_3: Checkpoint = empty_checkpoint()
+
+METADATA_1: CheckpointMetadata = {
+    "source": "input",
+    "step": 2,
+    "writes": {},
+    "score": 1,
+    "a.b": "dotted",
+}
+METADATA_2: CheckpointMetadata = {
+    "source": "loop",
+    "step": 1,
+    "writes": {"foo": "bar"},
+    "score": None,
+}
+METADATA_3: CheckpointMetadata = {}
+
+
+@pytest.fixture(scope="module")
+def saver() -> Iterator[DuckDBSaver]:
+    # run the schema migrations once per module, tests use unique thread IDs
+    with DuckDBSaver.from_conn_string(":memory:") as saver:
+        saver.setup()
+        yield saver
+
 
 class TestDuckDBSaver:
     @pytest.fixture(autouse=True)
-    def setup(self) -> None:
+    def setup(self, request: pytest.FixtureRequest) -> None:
         # objects for test setup
+        self.thread_1 = f"thread-1-{request.node.name}"
+        self.thread_2 = f"thread-2-{request.node.name}"
         self.config_1: RunnableConfig = {
             "configurable": {
-                "thread_id": "thread-1",
+                "thread_id": self.thread_1,
                 # for backwards compatibility testing
                 "thread_ts": "1",
                 "checkpoint_ns": "",
@@ -26,86 +58,119 @@ class TestDuckDBSaver:
         }
         self.config_2: RunnableConfig = {
             "configurable": {
-                "thread_id": "thread-2",
+                "thread_id": self.thread_2,
                 "checkpoint_id": "2",
                 "checkpoint_ns": "",
             }
         }
         self.config_3: RunnableConfig = {
             "configurable": {
-                "thread_id": "thread-2",
+                "thread_id": self.thread_2,
                 "checkpoint_id": "2-inner",
                 "checkpoint_ns": "inner",
             }
         }
 
-        self.chkpnt_1: Checkpoint = empty_checkpoint()
-        self.chkpnt_2: Checkpoint = create_checkpoint(self.chkpnt_1, {}, 1)
-        self.chkpnt_3: Checkpoint = empty_checkpoint()
+    def _search(
+        self, saver: DuckDBSaver, filter: dict[str, Any]
+    ) -> list[CheckpointTuple]:
+        # the saver is shared by the module, so only look at this test's threads
+        return [
+            c
+            for c in saver.list(None, filter=filter)
+            if c.config["configurable"]["thread_id"] in (self.thread_1, self.thread_2)
+        ]
 
-        self.metadata_1: CheckpointMetadata = {
-            "source": "input",
-            "step": 2,
-            "writes": {},
-            "score": 1,
-        }
-        self.metadata_2: CheckpointMetadata = {
-            "source": "loop",
+    def test_search(self, saver: DuckDBSaver) -> None:
+        # save checkpoints
+        saver.put_many(
+            [
+                (self.config_1, CHKPNT_1, METADATA_1, {}),
+                (self.config_2, CHKPNT_2, METADATA_2, {}),
+                (self.config_3, CHKPNT_3, METADATA_3, {}),
+            ]
+        )
+
+        # call method / assertions
+        query_1 = {"source": "input"}  # search by 1 key
+        query_2 = {
             "step": 1,
             "writes": {"foo": "bar"},
-            "score": None,
-        }
-        self.metadata_3: CheckpointMetadata = {}
-
-    def test_search(self) -> None:
-        with DuckDBSaver.from_conn_string(":memory:") as saver:
-            saver.setup()
-            # save checkpoints
-            saver.put(self.config_1, self.chkpnt_1, self.metadata_1, {})
-            saver.put(self.config_2, self.chkpnt_2, self.metadata_2, {})
-            saver.put(self.config_3, self.chkpnt_3, self.metadata_3, {})
-
-            # call method / assertions
-            query_1 = {"source": "input"}  # search by 1 key
-            query_2 = {
-                "step": 1,
-                "writes": {"foo": "bar"},
-            }  # search by multiple keys
-            query_3: dict[str, Any] = {}  # search by no keys, return all checkpoints
-            query_4 = {"source": "update", "step": 1}  # no match
-
-            search_results_1 = list(saver.list(None, filter=query_1))
-            assert len(search_results_1) == 1
-            assert search_results_1[0].metadata == self.metadata_1
-
-            search_results_2 = list(saver.list(None, filter=query_2))
-            assert len(search_results_2) == 1
-            assert search_results_2[0].metadata == self.metadata_2
-
-            search_results_3 = list(saver.list(None, filter=query_3))
-            assert len(search_results_3) == 3
-
-            search_results_4 = list(saver.list(None, filter=query_4))
-            assert len(search_results_4) == 0
-
-            # search by config (defaults to checkpoints across all namespaces)
-            search_results_5 = list(
-                saver.list({"configurable": {"thread_id": "thread-2"}})
-            )
-            assert len(search_results_5) == 2
-            assert {
-                search_results_5[0].config["configurable"]["checkpoint_ns"],
-                search_results_5[1].config["configurable"]["checkpoint_ns"],
-            } == {"", "inner"}
-
-            # TODO: test before and limit params
-
-    def test_null_chars(self) -> None:
-        with DuckDBSaver.from_conn_string(":memory:") as saver:
-            saver.setup()
-            config = saver.put(self.config_1, self.chkpnt_1, {"my_key": "\x00abc"}, {})
-            assert saver.get_tuple(config).metadata["my_key"] == "abc"  # type: ignore
-            assert (
-                list(saver.list(None, filter={"my_key": "abc"}))[0].metadata["my_key"]  # type: ignore
-                == "abc"
+        }  # search by multiple keys
+        query_3: dict[str, Any] = {}  # search by no keys, return all checkpoints
+        query_4 = {"source": "update", "step": 1}  # no match
+        query_5 = {"foo": "bar"}  # only matches top-level keys
+        query_6 = {"a.b": "dotted"}  # dots in a key are part of the key
+        query_7 = {"writes.foo": "bar"}  # not a nested path
+
+        search_results_1 = self._search(saver, query_1)
+        assert len(search_results_1) == 1
+        assert search_results_1[0].metadata == METADATA_1
+
+        search_results_2 = self._search(saver, query_2)
+        assert len(search_results_2) == 1
+        assert search_results_2[0].metadata == METADATA_2
+
+        search_results_3 = self._search(saver, query_3)
+        assert len(search_results_3) == 3
+
+        search_results_4 = self._search(saver, query_4)
+        assert len(search_results_4) == 0
+
+        search_results_5 = self._search(saver, query_5)
+        assert len(search_results_5) == 0
+
+        search_results_6 = self._search(saver, query_6)
+        assert len(search_results_6) == 1
+        assert search_results_6[0].metadata == METADATA_1
+
+        search_results_7 = self._search(saver, query_7)
+        assert len(search_results_7) == 0
+
+        # search by config (defaults to checkpoints across all namespaces)
+        search_results_8 = list(
+            saver.list({"configurable": {"thread_id": self.thread_2}})
+        )
+        assert len(search_results_8) == 2
+        assert {
+            search_results_8[0].config["configurable"]["checkpoint_ns"],
+            search_results_8[1].config["configurable"]["checkpoint_ns"],
+        } == {"", "inner"}
+
+        # TODO: test before and limit params
+
+    def test_put_many_rolls_back_on_error(self, saver: DuckDBSaver) -> None:
+        # the second checkpoint has no id, which the checkpoints table rejects
+        bad_checkpoint: Checkpoint = {**CHKPNT_3, "id": None}  # type: ignore[typeddict-item]
+        with pytest.raises(duckdb.ConstraintException):
+            saver.put_many(
+                [
+                    (self.config_1, CHKPNT_2, METADATA_1, {}),
+                    (self.config_2, bad_checkpoint, METADATA_2, {}),
+                ]
             )
+
+        assert saver.get_tuple(self.config_1) is None
+        assert list(saver.list({"configurable": {"thread_id": self.thread_1}})) == []
+
+        # the saver is still usable after the rollback (with metadata that no
+        # other test filters on, since the saver is shared by the module)
+        saved_config = saver.put(
+            self.config_1, CHKPNT_2, {"source": "rollback-test"}, {}
+        )
+        assert saver.get_tuple(saved_config) is not None
+
+    def test_null_chars(self, saver: DuckDBSaver) -> None:
+        config = saver.put(self.config_1, CHKPNT_1, {"my_key": "\x00abc"}, {})
+        assert saver.get_tuple(config).metadata["my_key"] == "abc"  # type: ignore
+        assert (
+            self._search(saver, {"my_key": "abc"})[0].metadata["my_key"]  # type: ignore
+            == "abc"
+        )
+
+    def test_search_big_int(self, saver: DuckDBSaver) -> None:
+        # integers outside the 64-bit range can't be encoded by orjson
+        saver.put(self.config_1, CHKPNT_1, {"big": 10**20}, {})
+        search_results = self._search(saver, {"big": 10**20})
+        assert len(search_results) == 1
+        assert search_results[0].metadata["big"] == 10**20  # type: ignore
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+from collections import OrderedDict
 from collections.abc import AsyncIterator, Iterable, Sequence
 from contextlib import asynccontextmanager
 from typing import Any, Callable, Optional, Union, cast
@@ -30,6 +31,7 @@ from langgraph.store.postgres.base import (
     _group_ops,
     _row_to_item,
     _row_to_search_item,
+    _vector_to_text,
 )
 
 logger = logging.getLogger(__name__)
@@ -112,6 +114,7 @@ class AsyncPostgresStore(AsyncBatchedBaseStore, BasePostgresStore[_ainternal.Con
         "supports_pipeline",
         "index_config",
         "embeddings",
+        "_embedding_cache",
     )
 
     def __init__(
@@ -136,6 +139,7 @@ class AsyncPostgresStore(AsyncBatchedBaseStore, BasePostgresStore[_ainternal.Con
         self.loop = asyncio.get_running_loop()
         self.supports_pipeline = Capabilities().has_pipeline()
         self.index_config = index
+        self._embedding_cache = OrderedDict()
         if self.index_config:
             self.embeddings, self.index_config = _ensure_index_config(self.index_config)
 
@@ -296,11 +300,13 @@ class AsyncPostgresStore(AsyncBatchedBaseStore, BasePostgresStore[_ainternal.Con
         results: list[Result],
         cur: AsyncCursor[DictRow],
     ) -> None:
-        for query, params, namespace, items in self._get_batch_GET_ops_queries(get_ops):
+        for query, params, namespace, (idxs, keys) in self._get_batch_GET_ops_queries(
+            get_ops
+        ):
             await cur.execute(query, params)
             rows = cast(list[Row], await cur.fetchall())
             key_to_row = {row["key"]: row for row in rows}
-            for idx, key in items:
+            for idx, key in zip(idxs, keys):
                 row = key_to_row.get(key)
                 if row:
                     results[idx] = _row_to_item(
@@ -325,22 +331,22 @@ class AsyncPostgresStore(AsyncBatchedBaseStore, BasePostgresStore[_ainternal.Con
                     f"Please provide an EmbeddingConfig when initializing the {self.__class__.__name__}."
                 )
             query, txt_params = embedding_request
-            vectors = await self.embeddings.aembed_documents(
+            vectors, to_embed = self._get_cached_embeddings(
                 [param[-1] for param in txt_params]
             )
-            queries.append(
-                (
-                    query,
-                    [
-                        p
-                        for (ns, k, pathname, _), vector in zip(txt_params, vectors)
-                        for p in (ns, k, pathname, vector)
-                    ],
-                )
-            )
-
-        for query, params in queries:
-            await cur.execute(query, params)
+            if to_embed:
+                embedded = [
+                    _vector_to_text(vector)
+                    for vector in await self.embeddings.aembed_documents(to_embed)
+                ]
+                self._cache_embeddings(to_embed, embedded)
+                vectors.update(zip(to_embed, embedded))
+            prefixes, keys, pathnames, texts = map(list, zip(*txt_params))
+            embeddings = [vectors[text] for text in texts]
+            queries.append((query, [(prefixes, keys, pathnames, embeddings)]))
+
+        for query, params_seq in queries:
+            await cur.executemany(query, params_seq)
 
     async def _batch_search_ops(
         self,
@@ -358,18 +364,18 @@ class AsyncPostgresStore(AsyncBatchedBaseStore, BasePostgresStore[_ainternal.Con
                 _paramslist = queries[idx][1]
                 for i in range(len(_paramslist)):
                     if _paramslist[i] is _PLACEHOLDER:
-                        _paramslist[i] = vector
+                        _paramslist[i] = _vector_to_text(vector)
 
         for (idx, _), (query, params) in zip(search_ops, queries):
             await cur.execute(query, params)
-            rows = cast(list[Row], await cur.fetchall())
-            items = [
+            results[idx] = [
                 _row_to_search_item(
-                    _decode_ns_bytes(row["prefix"]), row, loader=self._deserializer
+                    _decode_ns_bytes(row["prefix"]),
+                    cast(Row, row),
+                    loader=self._deserializer,
                 )
-                for row in rows
+                async for row in cur
             ]
-            results[idx] = items
 
     async def _batch_list_namespaces_ops(
         self,
@@ -1,9 +1,13 @@
 import asyncio
+import functools
+import hashlib
 import json
 import logging
+import math
 import threading
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime
 from typing import (
@@ -73,6 +77,10 @@ CREATE TABLE IF NOT EXISTS store (
     """
 -- For faster lookups by prefix
 CREATE INDEX CONCURRENTLY IF NOT EXISTS store_prefix_idx ON store USING btree (prefix text_pattern_ops);
+""",
+    """
+-- For faster equality filters on values (value @> ...)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS store_value_idx ON store USING gin (value jsonb_path_ops);
 """,
 ]
 
@@ -159,12 +167,18 @@ class ANNIndexConfig(TypedDict, total=False):
     """Configuration for vector index in PostgreSQL store."""
 
     kind: Literal["hnsw", "ivfflat", "flat"]
-    """Type of index to use: 'hnsw' for Hierarchical Navigable Small World, or 'ivfflat' for Inverted File Flat."""
+    """Type of index to use: 'hnsw' for Hierarchical Navigable Small World, or 'ivfflat' for Inverted File Flat.
+    Defaults to 'hnsw', which does not need training data to be present when the index is created."""
     vector_type: Literal["vector", "halfvec"]
     """Type of vector storage to use.
     Options:
     - 'vector': Regular vectors (default)
-    - 'halfvec': Half-precision vectors for reduced memory usage
+    - 'halfvec': Half-precision vectors for reduced memory usage. Halves the size of
+      the stored embeddings and of the vector index, with little loss of recall for
+      normalized embeddings. Requires pgvector 0.7.0 or later.
+
+    The vector type is fixed when `setup()` first creates the `store_vectors` table,
+    so it can't be changed for an existing store.
     """
 
 
@@ -211,6 +225,15 @@ class PostgresIndexConfig(IndexConfig, total=False):
     - 'inner_product': Dot product
     - 'cosine': Cosine similarity
     """
+    embedding_cache_size: int
+    """Maximum number of document embeddings to keep in memory, keyed on a hash of the text.
+
+    Texts that were embedded recently (e.g. documents that are put again unchanged)
+    reuse the cached vector instead of calling the embedding model again.
+    The cache is held by each store instance, so it is per process and is not
+    shared between workers. Vectors are kept in the text form sent to pgvector.
+    Defaults to 1000. Set to 0 to disable the cache.
+    """
 
 
 class BasePostgresStore(Generic[C]):
@@ -218,33 +241,38 @@ class BasePostgresStore(Generic[C]):
     VECTOR_MIGRATIONS = VECTOR_MIGRATIONS
     conn: C
     _deserializer: Optional[Callable[[Union[bytes, orjson.Fragment]], dict[str, Any]]]
+    _embedding_cache: "OrderedDict[bytes, str]"
     index_config: Optional[PostgresIndexConfig]
 
     def _get_batch_GET_ops_queries(
         self,
         get_ops: Sequence[tuple[int, GetOp]],
-    ) -> list[tuple[str, tuple, tuple[str, ...], list]]:
-        namespace_groups = defaultdict(list)
+    ) -> list[tuple[str, tuple, tuple[str, ...], tuple[list[int], list[str]]]]:
+        # op indices and keys for each namespace, filled in a single pass
+        namespace_groups: dict[tuple[str, ...], tuple[list[int], list[str]]] = {}
         for idx, op in get_ops:
-            namespace_groups[op.namespace].append((idx, op.key))
-        results = []
-        for namespace, items in namespace_groups.items():
-            _, keys = zip(*items)
-            keys_to_query = ",".join(["%s"] * len(keys))
-            query = f"""
-                SELECT key, value, created_at, updated_at
-                FROM store
-                WHERE prefix = %s AND key IN ({keys_to_query})
-            """
-            params = (_namespace_to_text(namespace), *keys)
-            results.append((query, params, namespace, items))
-        return results
+            group = namespace_groups.get(op.namespace)
+            if group is None:
+                group = namespace_groups[op.namespace] = ([], [])
+            group[0].append(idx)
+            group[1].append(op.key)
+        # keys are passed as a single array so the query text (and its
+        # prepared statement) doesn't depend on the number of keys
+        query = """
+            SELECT key, value, created_at, updated_at
+            FROM store
+            WHERE prefix = %s AND key = ANY(%s)
+        """
+        return [
+            (query, (_namespace_to_text(namespace), group[1]), namespace, group)
+            for namespace, group in namespace_groups.items()
+        ]
 
     def _prepare_batch_PUT_queries(
         self,
         put_ops: Sequence[tuple[int, PutOp]],
     ) -> tuple[
-        list[tuple[str, Sequence]],
+        list[tuple[str, Sequence[Sequence]]],
         Optional[tuple[str, Sequence[tuple[str, str, str, str]]]],
     ]:
         # Last-write wins
@@ -260,77 +288,85 @@ class BasePostgresStore(Generic[C]):
             else:
                 inserts.append(op)
 
-        queries: list[tuple[str, Sequence]] = []
+        # each query is paired with a list of param sets, to be run with executemany
+        queries: list[tuple[str, Sequence[Sequence]]] = []
 
         if deletes:
             namespace_groups: dict[tuple[str, ...], list[str]] = defaultdict(list)
             for op in deletes:
                 namespace_groups[op.namespace].append(op.key)
-            for namespace, keys in namespace_groups.items():
-                placeholders = ",".join(["%s"] * len(keys))
-                query = (
-                    f"DELETE FROM store WHERE prefix = %s AND key IN ({placeholders})"
+            query = "DELETE FROM store WHERE prefix = %s AND key = ANY(%s)"
+            queries.append(
+                (
+                    query,
+                    [
+                        (_namespace_to_text(namespace), keys)
+                        for namespace, keys in namespace_groups.items()
+                    ],
                 )
-                params = (_namespace_to_text(namespace), *keys)
-                queries.append((query, params))
+            )
         embedding_request: Optional[tuple[str, Sequence[tuple[str, str, str, str]]]] = (
             None
         )
         if inserts:
+            prefixes = []
+            keys = []
             values = []
-            insertion_params = []
-            vector_values = []
-            embedding_request_params = []
+            embedding_request_params: list[tuple[str, str, str, str]] = []
+
+            # the configured fields only need resolving once per batch
+            default_paths = (
+                self.index_config["__tokenized_fields"] if self.index_config else None
+            )
+            add_embedding_request = embedding_request_params.append
 
-            # First handle main store insertions
             for op in inserts:
-                values.append("(%s, %s, %s, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)")
-                insertion_params.extend(
-                    [
-                        _namespace_to_text(op.namespace),
-                        op.key,
-                        Jsonb(cast(dict, op.value)),
-                    ]
-                )
+                ns = _namespace_to_text(op.namespace)
+                k = op.key
+                value = op.value
+                prefixes.append(ns)
+                keys.append(k)
+                values.append(Jsonb(cast(dict, value), dumps=_json_dumps))
+
+                # Then handle embeddings if configured
+                if default_paths is None or op.index is False:
+                    continue
+                if op.index is None:
+                    paths = default_paths
+                else:
+                    paths = [(ix, tokenize_path(ix)) for ix in op.index]
 
-            # Then handle embeddings if configured
-            if self.index_config:
-                for op in inserts:
-                    if op.index is False:
+                for path, tokenized_path in paths:
+                    texts = get_text_at_path(value, tokenized_path)
+                    if len(texts) == 1:
+                        add_embedding_request((ns, k, path, texts[0]))
                         continue
-                    value = op.value
-                    ns = _namespace_to_text(op.namespace)
-                    k = op.key
+                    for i, text in enumerate(texts):
+                        add_embedding_request((ns, k, f"{path}.{i}", text))
 
-                    if op.index is None:
-                        paths = self.index_config["__tokenized_fields"]
-                    else:
-                        paths = [(ix, tokenize_path(ix)) for ix in op.index]
-
-                    for path, tokenized_path in paths:
-                        texts = get_text_at_path(value, tokenized_path)
-                        for i, text in enumerate(texts):
-                            pathname = f"{path}.{i}" if len(texts) > 1 else path
-                            vector_values.append(
-                                "(%s, %s, %s, %s, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
-                            )
-                            embedding_request_params.append((ns, k, pathname, text))
-
-            values_str = ",".join(values)
-            query = f"""
+            # all rows are sent as arrays in a single statement, regardless of batch size
+            query = """
                 INSERT INTO store (prefix, key, value, created_at, updated_at)
-                VALUES {values_str}
+                SELECT prefix, key, value, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+                FROM unnest(%s::text[], %s::text[], %s::jsonb[]) AS t(prefix, key, value)
                 ON CONFLICT (prefix, key) DO UPDATE
                 SET value = EXCLUDED.value,
                     updated_at = CURRENT_TIMESTAMP
             """
-            queries.append((query, insertion_params))
+            queries.append((query, [(prefixes, keys, values)]))
 
-            if vector_values:
-                values_str = ",".join(vector_values)
+            if embedding_request_params:
+                vector_type = (
+                    cast(PostgresIndexConfig, self.index_config)
+                    .get("ann_index_config", {})
+                    .get("vector_type", "vector")
+                )
+                # embeddings are sent as pgvector text, one array element per row
                 query = f"""
                     INSERT INTO store_vectors (prefix, key, field_name, embedding, created_at, updated_at)
-                    VALUES {values_str}
+                    SELECT prefix, key, field_name, embedding::{vector_type}, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+                    FROM unnest(%s::text[], %s::text[], %s::text[], %s::text[])
+                        AS t(prefix, key, field_name, embedding)
                     ON CONFLICT (prefix, key, field_name) DO UPDATE
                     SET embedding = EXCLUDED.embedding,
                         updated_at = CURRENT_TIMESTAMP
@@ -339,6 +375,44 @@ class BasePostgresStore(Generic[C]):
 
         return queries, embedding_request
 
+    def _get_cached_embeddings(
+        self, texts: Sequence[str]
+    ) -> tuple[dict[str, str], list[str]]:
+        """Look up document embeddings in the in-memory cache.
+
+        Returns the cached vectors (in pgvector's text format, see `_vector_to_text`)
+        by text and the unique texts that still need to be embedded.
+        """
+        cached: dict[str, str] = {}
+        missing: dict[str, None] = {}
+        for text in texts:
+            if text in cached or text in missing:
+                continue
+            key = _embedding_cache_key(text)
+            vector = self._embedding_cache.pop(key, None)
+            if vector is None:
+                missing[text] = None
+            else:
+                # re-insert to mark as most recently used
+                self._embedding_cache[key] = vector
+                cached[text] = vector
+        return cached, list(missing)
+
+    def _cache_embeddings(self, texts: Sequence[str], vectors: Sequence[str]) -> None:
+        """Add document embeddings to the in-memory cache, evicting the least recently used."""
+        cache_size = cast(PostgresIndexConfig, self.index_config).get(
+            "embedding_cache_size", _DEFAULT_EMBEDDING_CACHE_SIZE
+        )
+        if cache_size <= 0:
+            return
+        for text, vector in zip(texts, vectors):
+            self._embedding_cache[_embedding_cache_key(text)] = vector
+        while len(self._embedding_cache) > cache_size:
+            try:
+                self._embedding_cache.popitem(last=False)
+            except KeyError:
+                break
+
     def _prepare_batch_search_queries(
         self,
         search_ops: Sequence[tuple[int, SearchOp]],
@@ -346,25 +420,26 @@ class BasePostgresStore(Generic[C]):
         list[tuple[str, list[Union[None, str, list[float]]]]],  # queries, params
         list[tuple[int, str]],  # idx, query_text pairs to embed
     ]:
-        queries = []
+        queries: list[tuple[str, list]] = []
         embedding_requests = []
 
         for idx, (_, op) in enumerate(search_ops):
+            if not op.filter and not (op.query and self.index_config):
+                # Plain namespace listing, the most common shape of search
+                queries.append(
+                    (
+                        _PLAIN_SEARCH_SQL,
+                        [
+                            f"{_namespace_to_text(op.namespace_prefix)}%",
+                            op.limit,
+                            op.offset,
+                        ],
+                    )
+                )
+                continue
+
             # Build filter conditions first
-            filter_params = []
-            filter_conditions = []
-            if op.filter:
-                for key, value in op.filter.items():
-                    if isinstance(value, dict):
-                        for op_name, val in value.items():
-                            condition, filter_params_ = self._get_filter_condition(
-                                key, op_name, val
-                            )
-                            filter_conditions.append(condition)
-                            filter_params.extend(filter_params_)
-                    else:
-                        filter_conditions.append("value->%s = %s::jsonb")
-                        filter_params.extend([key, json.dumps(value)])
+            filter_conditions, filter_params = self._get_filter_conditions(op.filter)
 
             # Vector search branch
             if op.query and self.index_config:
@@ -441,20 +516,22 @@ class BasePostgresStore(Generic[C]):
 
             # Regular search branch
             else:
-                base_query = """
+                filter_str = "".join(
+                    f" AND {condition}" for condition in filter_conditions
+                )
+                base_query = f"""
                     SELECT prefix, key, value, created_at, updated_at
                     FROM store
-                    WHERE prefix LIKE %s
+                    WHERE prefix LIKE %s{filter_str}
+                    ORDER BY updated_at DESC
+                    LIMIT %s OFFSET %s
                 """
-                params = [f"{_namespace_to_text(op.namespace_prefix)}%"]
-
-                if filter_conditions:
-                    params.extend(filter_params)
-                    base_query += " AND " + " AND ".join(filter_conditions)
-
-                base_query += " ORDER BY updated_at DESC"
-                base_query += " LIMIT %s OFFSET %s"
-                params.extend([op.limit, op.offset])
+                params = [
+                    f"{_namespace_to_text(op.namespace_prefix)}%",
+                    *filter_params,
+                    op.limit,
+                    op.offset,
+                ]
 
             queries.append((base_query, params))
 
@@ -473,12 +550,8 @@ class BasePostgresStore(Generic[C]):
                         prefix,
                         CASE
                             WHEN %s::integer IS NOT NULL THEN
-                                (SELECT STRING_AGG(part, '.' ORDER BY idx)
-                                 FROM (
-                                     SELECT part, ROW_NUMBER() OVER () AS idx
-                                     FROM UNNEST(REGEXP_SPLIT_TO_ARRAY(prefix, '\.')) AS part
-                                     LIMIT %s::integer
-                                 ) subquery
+                                array_to_string(
+                                    (string_to_array(prefix, '.'))[1:%s::integer], '.'
                                 )
                             ELSE prefix
                         END AS truncated_prefix
@@ -514,20 +587,49 @@ class BasePostgresStore(Generic[C]):
 
         return queries
 
+    def _get_filter_conditions(
+        self, filter: Optional[dict[str, Any]]
+    ) -> tuple[list[str], list]:
+        """Helper to generate the filter conditions of a search.
+
+        Equality checks against scalar values are combined into a single
+        `value @> %s` containment check, which can use the GIN index on `value`.
+        """
+        conditions: list[str] = []
+        params: list = []
+        if not filter:
+            return conditions, params
+        contained: dict[str, Any] = {}
+        for key, value in filter.items():
+            if isinstance(value, dict):
+                for op_name, val in value.items():
+                    if op_name == "$eq" and _is_json_scalar(val):
+                        contained[key] = val
+                        continue
+                    condition, params_ = self._get_filter_condition(key, op_name, val)
+                    conditions.append(condition)
+                    params.extend(params_)
+            elif _is_json_scalar(value):
+                contained[key] = value
+            else:
+                condition, params_ = self._get_filter_condition(key, "$eq", value)
+                conditions.append(condition)
+                params.extend(params_)
+        if contained:
+            conditions.insert(0, "value @> %s")
+            params.insert(0, Jsonb(contained, dumps=_json_dumps))
+        return conditions, params
+
     def _get_filter_condition(self, key: str, op: str, value: Any) -> tuple[str, list]:
         """Helper to generate filter conditions."""
-        if op == "$eq":
-            return "value->%s = %s::jsonb", [key, json.dumps(value)]
-        elif op == "$gt":
-            return "value->>%s > %s", [key, str(value)]
-        elif op == "$gte":
-            return "value->>%s >= %s", [key, str(value)]
-        elif op == "$lt":
-            return "value->>%s < %s", [key, str(value)]
-        elif op == "$lte":
-            return "value->>%s <= %s", [key, str(value)]
-        elif op == "$ne":
-            return "value->%s != %s::jsonb", [key, json.dumps(value)]
+        if op in _JSONB_FILTER_TEMPLATES:
+            return _JSONB_FILTER_TEMPLATES[op], [key, _json_dumps(value).decode()]
+        elif op in _COMPARISON_TEMPLATES:
+            text_template, numeric_template = _COMPARISON_TEMPLATES[op]
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                # compare numbers as numbers, not as their text representation
+                return numeric_template, [key, key, _json_dumps(value).decode()]
+            return text_template, [key, str(value)]
         else:
             raise ValueError(f"Unsupported operator: {op}")
 
@@ -592,6 +694,8 @@ class PostgresStore(BaseStore, BasePostgresStore[_pg_internal.Conn]):
         "supports_pipeline",
         "index_config",
         "embeddings",
+        "_embedding_cache",
+        "_executor",
     )
 
     def __init__(
@@ -603,14 +707,18 @@ class PostgresStore(BaseStore, BasePostgresStore[_pg_internal.Conn]):
             Callable[[Union[bytes, orjson.Fragment]], dict[str, Any]]
         ] = None,
         index: Optional[PostgresIndexConfig] = None,
+        executor: Optional[Executor] = None,
     ) -> None:
         super().__init__()
         self._deserializer = deserializer
+        # runs batches for abatch(); None means the event loop's default executor
+        self._executor = executor
         self.conn = conn
         self.pipe = pipe
         self.supports_pipeline = Capabilities().has_pipeline()
         self.lock = threading.Lock()
         self.index_config = index
+        self._embedding_cache = OrderedDict()
         if self.index_config:
             self.embeddings, self.index_config = _ensure_index_config(self.index_config)
         else:
@@ -655,8 +763,13 @@ class PostgresStore(BaseStore, BasePostgresStore[_pg_internal.Conn]):
                     },
                     **cast(dict, pc),
                 ),
-            ) as pool:
-                yield cls(conn=pool, index=index)
+            ) as pool, ThreadPoolExecutor(
+                # one thread per pooled connection, so the pool is the only limit
+                # on how many batches run concurrently from async callers
+                max_workers=pool.max_size,
+                thread_name_prefix="PostgresStore",
+            ) as executor:
+                yield cls(conn=pool, index=index, executor=executor)
         else:
             with Connection.connect(
                 conn_string, autocommit=True, prepare_threshold=0, row_factory=dict_row
@@ -747,11 +860,13 @@ class PostgresStore(BaseStore, BasePostgresStore[_pg_internal.Conn]):
         results: list[Result],
         cur: Cursor[DictRow],
     ) -> None:
-        for query, params, namespace, items in self._get_batch_GET_ops_queries(get_ops):
+        for query, params, namespace, (idxs, keys) in self._get_batch_GET_ops_queries(
+            get_ops
+        ):
             cur.execute(query, params)
             rows = cast(list[Row], cur.fetchall())
             key_to_row = {row["key"]: row for row in rows}
-            for idx, key in items:
+            for idx, key in zip(idxs, keys):
                 row = key_to_row.get(key)
                 if row:
                     results[idx] = _row_to_item(
@@ -777,22 +892,22 @@ class PostgresStore(BaseStore, BasePostgresStore[_pg_internal.Conn]):
                 )
             query, txt_params = embedding_request
             # Update the params to replace the raw text with the vectors
-            vectors = self.embeddings.embed_documents(
+            vectors, to_embed = self._get_cached_embeddings(
                 [param[-1] for param in txt_params]
             )
-            queries.append(
-                (
-                    query,
-                    [
-                        p
-                        for (ns, k, pathname, _), vector in zip(txt_params, vectors)
-                        for p in (ns, k, pathname, vector)
-                    ],
-                )
-            )
+            if to_embed:
+                embedded = [
+                    _vector_to_text(vector)
+                    for vector in self.embeddings.embed_documents(to_embed)
+                ]
+                self._cache_embeddings(to_embed, embedded)
+                vectors.update(zip(to_embed, embedded))
+            prefixes, keys, pathnames, texts = map(list, zip(*txt_params))
+            embeddings = [vectors[text] for text in texts]
+            queries.append((query, [(prefixes, keys, pathnames, embeddings)]))
 
-        for query, params in queries:
-            cur.execute(query, params)
+        for query, params_seq in queries:
+            cur.executemany(query, params_seq)
 
     def _batch_search_ops(
         self,
@@ -810,16 +925,17 @@ class PostgresStore(BaseStore, BasePostgresStore[_pg_internal.Conn]):
                 _paramslist = queries[idx][1]
                 for i in range(len(_paramslist)):
                     if _paramslist[i] is _PLACEHOLDER:
-                        _paramslist[i] = embedding
+                        _paramslist[i] = _vector_to_text(embedding)
 
         for (idx, _), (query, params) in zip(search_ops, queries):
             cur.execute(query, params)
-            rows = cast(list[Row], cur.fetchall())
             results[idx] = [
                 _row_to_search_item(
-                    _decode_ns_bytes(row["prefix"]), row, loader=self._deserializer
+                    _decode_ns_bytes(row["prefix"]),
+                    cast(Row, row),
+                    loader=self._deserializer,
                 )
-                for row in rows
+                for row in cur
             ]
 
     def _batch_list_namespaces_ops(
@@ -835,7 +951,9 @@ class PostgresStore(BaseStore, BasePostgresStore[_pg_internal.Conn]):
             results[idx] = [_decode_ns_bytes(row["truncated_prefix"]) for row in cur]
 
     async def abatch(self, ops: Iterable[Op]) -> list[Result]:
-        return await asyncio.get_running_loop().run_in_executor(None, self.batch, ops)
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self.batch, ops
+        )
 
     def setup(self) -> None:
         """Set up the store database.
@@ -941,7 +1059,39 @@ def _get_index_params(store: Any) -> tuple[str, dict[str, Any]]:
     index_config = config.get("ann_index_config", _DEFAULT_ANN_CONFIG).copy()
     kind = index_config.pop("kind", "hnsw")
     index_config.pop("vector_type", None)
-    return kind, index_config
+    params = cast(dict[str, Any], index_config)
+    if kind == "ivfflat" and "nlist" in params:
+        # pgvector calls the number of inverted lists `lists`
+        params["lists"] = params.pop("nlist")
+    return kind, params
+
+
+_PLAIN_SEARCH_SQL = """
+    SELECT prefix, key, value, created_at, updated_at
+    FROM store
+    WHERE prefix LIKE %s
+    ORDER BY updated_at DESC
+    LIMIT %s OFFSET %s
+"""
+
+_JSONB_FILTER_TEMPLATES = {
+    "$eq": "value->%s = %s::jsonb",
+    "$ne": "value->%s != %s::jsonb",
+}
+# operator -> (text comparison, numeric comparison)
+# jsonb orders all strings before all numbers, so the numeric comparison only
+# considers values that are numbers (other values never match, and never error)
+_COMPARISON_TEMPLATES = {
+    op: (
+        f"value->>%s {operator} %s",
+        f"(jsonb_typeof(value->%s) = 'number' AND value->%s {operator} %s::jsonb)",
+    )
+    for op, operator in {"$gt": ">", "$gte": ">=", "$lt": "<", "$lte": "<="}.items()
+}
+
+
+def _is_json_scalar(value: Any) -> bool:
+    return value is None or isinstance(value, (str, int, float, bool))
 
 
 def _namespace_to_text(
@@ -950,6 +1100,14 @@ def _namespace_to_text(
     """Convert namespace tuple to text string."""
     if handle_wildcards:
         namespace = tuple("%" if val == "*" else val for val in namespace)
+    elif isinstance(namespace, tuple):
+        # the same namespaces tend to be used over and over across ops
+        return _joined_namespace(namespace)
+    return ".".join(namespace)
+
+
+@functools.lru_cache(maxsize=4096)
+def _joined_namespace(namespace: tuple[str, ...]) -> str:
     return ".".join(namespace)
 
 
@@ -1016,15 +1174,49 @@ def _group_ops(ops: Iterable[Op]) -> tuple[dict[type, list[tuple[int, Op]]], int
     return grouped_ops, tot
 
 
+_DEFAULT_EMBEDDING_CACHE_SIZE = 1000
+
+
+def _embedding_cache_key(text: str) -> bytes:
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+
+def _json_dumps(value: Any) -> bytes:
+    # used instead of psycopg's default (stdlib json.dumps) when sending jsonb params
+    try:
+        dumped = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        # e.g. integers outside the 64-bit range, which json handles
+        return json.dumps(value).encode()
+    if b"null" in dumped and _has_non_finite_float(value):
+        # orjson writes NaN and +/-Infinity as null; json writes them as-is, so
+        # Postgres rejects the value instead of silently storing null
+        return json.dumps(value).encode()
+    return dumped
+
+
+def _has_non_finite_float(value: Any) -> bool:
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite_float(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite_float(v) for v in value)
+    return False
+
+
+def _vector_to_text(vector: Sequence[float]) -> str:
+    # pgvector's text format is a JSON array, so orjson can write the whole vector
+    # in one call instead of psycopg adapting a float[] element by element. The
+    # untyped string is coerced to the target vector/halfvec type by the server.
+    return orjson.dumps(vector, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
 def _json_loads(content: Union[bytes, orjson.Fragment]) -> Any:
-    if isinstance(content, orjson.Fragment):
-        if hasattr(content, "buf"):
-            content = content.buf
-        else:
-            if isinstance(content.contents, bytes):
-                content = content.contents
-            else:
-                content = content.contents.encode()
+    if type(content) is orjson.Fragment:
+        # orjson.loads accepts bytes, bytearray, memoryview and str as-is,
+        # so the fragment's contents are passed through without re-encoding
+        content = content.buf if hasattr(content, "buf") else content.contents
     return orjson.loads(cast(bytes, content))
 
 
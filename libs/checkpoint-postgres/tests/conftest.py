@@ -36,9 +36,18 @@ async def clear_test_db(conn: AsyncConnection[DictRow]) -> None:
         pass
 
 
+FAKE_EMBEDDING_DIMS = 500
+
+
 @pytest.fixture
 def fake_embeddings() -> CharacterEmbeddings:
-    return CharacterEmbeddings(dims=500)
+    return CharacterEmbeddings(dims=FAKE_EMBEDDING_DIMS)
+
+
+@pytest.fixture(scope="module")
+def module_fake_embeddings() -> CharacterEmbeddings:
+    """Same as `fake_embeddings`, for module-scoped fixtures."""
+    return CharacterEmbeddings(dims=FAKE_EMBEDDING_DIMS)
 
 
 VECTOR_TYPES = ["vector", "halfvec"]
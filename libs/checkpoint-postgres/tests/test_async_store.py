@@ -3,14 +3,14 @@ import asyncio
 import itertools
 import sys
 import uuid
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterator
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from typing import Any, Optional
 
 import pytest
 from langchain_core.embeddings import Embeddings
-from psycopg import AsyncConnection
+from psycopg import AsyncConnection, sql
 
 from langgraph.store.base import (
     GetOp,
@@ -26,9 +26,34 @@ from tests.conftest import (
     CharacterEmbeddings,
 )
 
+_CREATE_DATABASE = sql.SQL("CREATE DATABASE {}")
+_DROP_DATABASE = sql.SQL("DROP DATABASE {}")
 
-@pytest.fixture(scope="function", params=["default", "pipe", "pool"])
-async def store(request) -> AsyncIterator[AsyncPostgresStore]:
+
+@pytest.fixture(scope="module")
+def event_loop() -> Iterator[asyncio.AbstractEventLoop]:
+    # module-scoped stores must live on the same loop as the tests using them
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+async def _truncate(store: AsyncPostgresStore) -> None:
+    async with store._cursor(pipeline=True) as cur:
+        await cur.execute("TRUNCATE store CASCADE")
+
+
+@pytest.fixture(scope="module")
+async def admin_conn() -> AsyncIterator[AsyncConnection]:
+    """One connection to the admin database for creating and dropping test databases."""
+    async with await AsyncConnection.connect(DEFAULT_URI, autocommit=True) as conn:
+        yield conn
+
+
+@pytest.fixture(scope="module", params=["default", "pipe", "pool"])
+async def module_store(
+    request, admin_conn: AsyncConnection
+) -> AsyncIterator[AsyncPostgresStore]:
     if sys.version_info < (3, 10):
         pytest.skip("Async Postgres tests require Python 3.10+")
 
@@ -41,12 +66,8 @@ async def store(request) -> AsyncIterator[AsyncPostgresStore]:
         query_params = "?" + query_params
 
     conn_string = f"{uri_base}/{database}{query_params}"
-    admin_conn_string = DEFAULT_URI
 
-    async with await AsyncConnection.connect(
-        admin_conn_string, autocommit=True
-    ) as conn:
-        await conn.execute(f"CREATE DATABASE {database}")
+    await admin_conn.execute(_CREATE_DATABASE.format(sql.Identifier(database)))
     try:
         async with AsyncPostgresStore.from_conn_string(conn_string) as store:
             await store.setup()
@@ -65,10 +86,16 @@ async def store(request) -> AsyncIterator[AsyncPostgresStore]:
             async with AsyncPostgresStore.from_conn_string(conn_string) as store:
                 yield store
     finally:
-        async with await AsyncConnection.connect(
-            admin_conn_string, autocommit=True
-        ) as conn:
-            await conn.execute(f"DROP DATABASE {database}")
+        await admin_conn.execute(_DROP_DATABASE.format(sql.Identifier(database)))
+
+
+@pytest.fixture
+async def store(
+    module_store: AsyncPostgresStore,
+) -> AsyncIterator[AsyncPostgresStore]:
+    # each test starts from an empty store without creating a new database
+    await _truncate(module_store)
+    yield module_store
 
 
 async def test_no_running_loop(store: AsyncPostgresStore) -> None:
@@ -321,6 +348,7 @@ async def test_batch_list_namespaces_ops(store: AsyncPostgresStore) -> None:
 
 @asynccontextmanager
 async def _create_vector_store(
+    admin_conn: AsyncConnection,
     vector_type: str,
     distance_type: str,
     fake_embeddings: CharacterEmbeddings,
@@ -339,7 +367,6 @@ async def _create_vector_store(
         query_params = "?" + query_params
 
     conn_string = f"{uri_base}/{database}{query_params}"
-    admin_conn_string = DEFAULT_URI
 
     index_config = {
         "dims": fake_embeddings.dims,
@@ -351,10 +378,7 @@ async def _create_vector_store(
         "text_fields": text_fields,
     }
 
-    async with await AsyncConnection.connect(
-        admin_conn_string, autocommit=True
-    ) as conn:
-        await conn.execute(f"CREATE DATABASE {database}")
+    await admin_conn.execute(_CREATE_DATABASE.format(sql.Identifier(database)))
     try:
         async with AsyncPostgresStore.from_conn_string(
             conn_string,
@@ -363,14 +387,11 @@ async def _create_vector_store(
             await store.setup()
             yield store
     finally:
-        async with await AsyncConnection.connect(
-            admin_conn_string, autocommit=True
-        ) as conn:
-            await conn.execute(f"DROP DATABASE {database}")
+        await admin_conn.execute(_DROP_DATABASE.format(sql.Identifier(database)))
 
 
 @pytest.fixture(
-    scope="function",
+    scope="module",
     params=[
         (vector_type, distance_type)
         for vector_type in VECTOR_TYPES
@@ -380,18 +401,27 @@ async def _create_vector_store(
     ],
     ids=lambda p: f"{p[0]}_{p[1]}",
 )
-async def vector_store(
+async def module_vector_store(
     request,
-    fake_embeddings: CharacterEmbeddings,
+    admin_conn: AsyncConnection,
+    module_fake_embeddings: CharacterEmbeddings,
 ) -> AsyncIterator[AsyncPostgresStore]:
     """Create a store with vector search enabled."""
     vector_type, distance_type = request.param
     async with _create_vector_store(
-        vector_type, distance_type, fake_embeddings
+        admin_conn, vector_type, distance_type, module_fake_embeddings
     ) as store:
         yield store
 
 
+@pytest.fixture
+async def vector_store(
+    module_vector_store: AsyncPostgresStore,
+) -> AsyncIterator[AsyncPostgresStore]:
+    await _truncate(module_vector_store)
+    yield module_vector_store
+
+
 async def test_vector_store_initialization(
     vector_store: AsyncPostgresStore, fake_embeddings: CharacterEmbeddings
 ) -> None:
@@ -415,8 +445,9 @@ async def test_vector_insert_with_auto_embedding(
         ("doc6", {"body": "text in body field"}),
     ]
 
-    for key, value in docs:
-        await vector_store.aput(("test",), key, value)
+    await vector_store.abatch(
+        [PutOp(namespace=("test",), key=key, value=value) for key, value in docs]
+    )
 
     results = await vector_store.asearch(("test",), query="long text")
     assert len(results) > 0
@@ -467,8 +498,9 @@ async def test_vector_search_with_filters(vector_store: AsyncPostgresStore) -> N
         ("doc4", {"text": "blue car", "color": "blue", "score": 3.5}),
     ]
 
-    for key, value in docs:
-        await vector_store.aput(("test",), key, value)
+    await vector_store.abatch(
+        [PutOp(namespace=("test",), key=key, value=value) for key, value in docs]
+    )
 
     results = await vector_store.asearch(
         ("test",), query="apple", filter={"color": "red"}
@@ -497,10 +529,16 @@ async def test_vector_search_with_filters(vector_store: AsyncPostgresStore) -> N
 
 async def test_vector_search_pagination(vector_store: AsyncPostgresStore) -> None:
     """Test pagination with vector search."""
-    for i in range(5):
-        await vector_store.aput(
-            ("test",), f"doc{i}", {"text": f"test document number {i}"}
-        )
+    await vector_store.abatch(
+        [
+            PutOp(
+                namespace=("test",),
+                key=f"doc{i}",
+                value={"text": f"test document number {i}"},
+            )
+            for i in range(5)
+        ]
+    )
 
     results_page1 = await vector_store.asearch(("test",), query="test", limit=2)
     results_page2 = await vector_store.asearch(
@@ -549,12 +587,14 @@ async def test_vector_search_edge_cases(vector_store: AsyncPostgresStore) -> Non
 )
 async def test_embed_with_path(
     request: Any,
+    admin_conn: AsyncConnection,
     fake_embeddings: CharacterEmbeddings,
     vector_type: str,
     distance_type: str,
 ) -> None:
     """Test vector search with specific text fields in Postgres store."""
     async with _create_vector_store(
+        admin_conn,
         vector_type,
         distance_type,
         fake_embeddings,
@@ -608,12 +648,14 @@ async def test_embed_with_path(
 )
 async def test_search_sorting(
     request: Any,
+    admin_conn: AsyncConnection,
     fake_embeddings: CharacterEmbeddings,
     vector_type: str,
     distance_type: str,
 ) -> None:
     """Test operation-level field configuration for vector search."""
     async with _create_vector_store(
+        admin_conn,
         vector_type,
         distance_type,
         fake_embeddings,
@@ -625,10 +667,15 @@ async def test_search_sorting(
 
         await store.aput(("test", "M"), "M", amatch)
         N = 100
-        for i in range(N):
-            await store.aput(("test", "A"), f"A{i}", {"key1": "no"})
-        for i in range(N):
-            await store.aput(("test", "Z"), f"Z{i}", {"key1": "no"})
+        await store.abatch(
+            [
+                PutOp(
+                    namespace=("test", prefix), key=f"{prefix}{i}", value={"key1": "no"}
+                )
+                for prefix in ("A", "Z")
+                for i in range(N)
+            ]
+        )
 
         results = await store.asearch(("test",), query="mmm", limit=10)
         assert len(results) == 10
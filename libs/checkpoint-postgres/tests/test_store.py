@@ -1,12 +1,13 @@
 # type: ignore
 
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from typing import Any, Optional
 from uuid import uuid4
 
 import pytest
 from langchain_core.embeddings import Embeddings
-from psycopg import Connection
+from psycopg import Connection, DataError
 
 from langgraph.store.base import (
     GetOp,
@@ -153,6 +154,18 @@ def test_batch_put_ops(store: PostgresStore) -> None:
     assert item3 is None
 
 
+async def test_abatch_uses_executor(store: PostgresStore, mocker: Any) -> None:
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        submit_spy = mocker.spy(executor, "submit")
+        async_store = PostgresStore(store.conn, pipe=store.pipe, executor=executor)
+
+        await async_store.aput(("test",), "key1", {"data": "value1"})
+        item = await async_store.aget(("test",), "key1")
+
+    assert item and item.value == {"data": "value1"}
+    assert submit_spy.call_count == 2
+
+
 def test_batch_search_ops(store: PostgresStore) -> None:
     # Setup test data
     test_data = [
@@ -306,12 +319,22 @@ class TestPostgresStore:
                 (
                     ("test", "docs"),
                     "doc1",
-                    {"title": "First Doc", "author": "Alice", "tags": ["important"]},
+                    {
+                        "title": "First Doc",
+                        "author": "Alice",
+                        "tags": ["important"],
+                        "pages": 9,
+                    },
                 ),
                 (
                     ("test", "docs"),
                     "doc2",
-                    {"title": "Second Doc", "author": "Bob", "tags": ["draft"]},
+                    {
+                        "title": "Second Doc",
+                        "author": "Bob",
+                        "tags": ["draft"],
+                        "pages": 10,
+                    },
                 ),
                 (
                     ("test", "images"),
@@ -337,6 +360,15 @@ class TestPostgresStore:
             assert len(alice_items) == 2
             assert all(item.value["author"] == "Alice" for item in alice_items)
 
+            alice_docs = store.search(
+                ["test"], filter={"author": {"$eq": "Alice"}, "tags": ["important"]}
+            )
+            assert [item.key for item in alice_docs] == ["doc1"]
+
+            # numeric comparisons don't compare the text representation
+            long_docs = store.search(["test"], filter={"pages": {"$gt": 9}})
+            assert [item.key for item in long_docs] == ["doc2"]
+
             # Test pagination
             paginated_items = store.search(["test"], limit=2)
             assert len(paginated_items) == 2
@@ -348,6 +380,46 @@ class TestPostgresStore:
             for namespace, key, _ in test_data:
                 store.delete(namespace, key)
 
+    def test_put_values_orjson_cannot_encode(self) -> None:
+        with PostgresStore.from_conn_string(DEFAULT_URI) as store:
+            namespace = ("test", "json")
+            # integers outside the 64-bit range are still accepted
+            store.put(namespace, "big", {"big": 10**20})
+            item = store.get(namespace, "big")
+            assert item and item.value["big"] == 10**20
+            results = store.search(namespace, filter={"big": 10**20})
+            assert [item.key for item in results] == ["big"]
+
+            # non-finite floats are rejected rather than stored as null
+            for key, value in [("nan", float("nan")), ("inf", float("inf"))]:
+                with pytest.raises(DataError):
+                    store.put(namespace, key, {"x": value})
+                assert store.get(namespace, key) is None
+
+            store.delete(namespace, "big")
+
+    def test_search_numeric_filter_mixed_types(self) -> None:
+        with PostgresStore.from_conn_string(DEFAULT_URI) as store:
+            namespace = ("test", "mixed")
+            test_data = [
+                ("int", {"n": 10}),
+                ("float", {"n": 2.5}),
+                ("text", {"n": "many"}),
+                ("list", {"n": [1, 2]}),
+                ("missing", {"m": 1}),
+            ]
+            for key, value in test_data:
+                store.put(namespace, key, value)
+
+            # values that aren't numbers are skipped rather than failing the query
+            results = store.search(namespace, filter={"n": {"$gt": 5}})
+            assert [item.key for item in results] == ["int"]
+            results = store.search(namespace, filter={"n": {"$lte": 5}})
+            assert [item.key for item in results] == ["float"]
+
+            for key, _ in test_data:
+                store.delete(namespace, key)
+
 
 @contextmanager
 def _create_vector_store(
@@ -355,6 +427,7 @@ def _create_vector_store(
     distance_type: str,
     fake_embeddings: Embeddings,
     text_fields: Optional[list[str]] = None,
+    ann_index_config: Optional[dict[str, Any]] = None,
 ) -> PostgresStore:
     """Create a store with vector search enabled."""
     database = f"test_{uuid4().hex[:16]}"
@@ -373,6 +446,7 @@ def _create_vector_store(
         "embed": fake_embeddings,
         "ann_index_config": {
             "vector_type": vector_type,
+            **(ann_index_config or {}),
         },
         "distance_type": distance_type,
         "text_fields": text_fields,
@@ -423,6 +497,19 @@ def test_vector_store_initialization(
     assert vector_store.index_config["embed"] == fake_embeddings
 
 
+def test_vector_store_ivfflat_index(fake_embeddings: CharacterEmbeddings) -> None:
+    """Test creating and searching a store with an IVFFlat index."""
+    with _create_vector_store(
+        "vector",
+        "cosine",
+        fake_embeddings,
+        ann_index_config={"kind": "ivfflat", "nlist": 10},
+    ) as store:
+        store.put(("test",), "doc1", {"text": "short text"})
+        results = store.search(("test",), query="short text")
+        assert [r.key for r in results] == ["doc1"]
+
+
 def test_vector_insert_with_auto_embedding(vector_store: PostgresStore) -> None:
     """Test inserting items that get auto-embedded."""
     docs = [
@@ -445,6 +532,20 @@ def test_vector_insert_with_auto_embedding(vector_store: PostgresStore) -> None:
     assert "doc3" in doc_order
 
 
+def test_vector_insert_reuses_cached_embeddings(
+    vector_store: PostgresStore, mocker: Any
+) -> None:
+    """Test that unchanged texts are not embedded again."""
+    embed_spy = mocker.spy(vector_store.embeddings, "embed_documents")
+    vector_store.put(("test",), "doc1", {"text": "repeated text"})
+    vector_store.put(("test",), "doc2", {"text": "repeated text"})
+    vector_store.put(("test",), "doc1", {"text": "repeated text"})
+    assert embed_spy.call_count == 1
+
+    results = vector_store.search(("test",), query="repeated text")
+    assert {r.key for r in results} == {"doc1", "doc2"}
+
+
 def test_vector_update_with_embedding(vector_store: PostgresStore) -> None:
     """Test that updating items properly updates their embeddings."""
     vector_store.put(("test",), "doc1", {"text": "zany zebra Xerxes"})
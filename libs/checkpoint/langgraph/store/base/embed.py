@@ -7,8 +7,10 @@ asynchronous operations.
 """
 
 import asyncio
+import functools
 import json
-from typing import Any, Awaitable, Callable, Optional, Sequence, Union
+import re
+from typing import Any, Awaitable, Callable, Optional, Reversible, Sequence, Union
 
 from langchain_core.embeddings import Embeddings
 
@@ -206,85 +208,18 @@ def get_text_at_path(obj: Any, path: Union[str, list[str]]) -> list[str]:
         - Nested paths in multi-field: "{field1,nested.field2}"
     """
     if not path or path == "$":
-        return [json.dumps(obj, sort_keys=True)]
+        return [_dumps_sorted(obj)]
 
-    tokens = tokenize_path(path) if isinstance(path, str) else path
+    ops = _compile_path(path) if isinstance(path, str) else _compile_tokens(tuple(path))
+    return _extract_from_obj(obj, ops)
 
-    def _extract_from_obj(obj: Any, tokens: list[str], pos: int) -> list[str]:
-        if pos >= len(tokens):
-            if isinstance(obj, (str, int, float, bool)):
-                return [str(obj)]
-            elif obj is None:
-                return []
-            elif isinstance(obj, (list, dict)):
-                return [json.dumps(obj, sort_keys=True)]
-            return []
 
-        token = tokens[pos]
-        results = []
-
-        if token.startswith("[") and token.endswith("]"):
-            if not isinstance(obj, list):
-                return []
-
-            index = token[1:-1]
-            if index == "*":
-                for item in obj:
-                    results.extend(_extract_from_obj(item, tokens, pos + 1))
-            else:
-                try:
-                    idx = int(index)
-                    if idx < 0:
-                        idx = len(obj) + idx
-                    if 0 <= idx < len(obj):
-                        results.extend(_extract_from_obj(obj[idx], tokens, pos + 1))
-                except (ValueError, IndexError):
-                    return []
-
-        elif token.startswith("{") and token.endswith("}"):
-            if not isinstance(obj, dict):
-                return []
-
-            fields = [f.strip() for f in token[1:-1].split(",")]
-            for field in fields:
-                nested_tokens = tokenize_path(field)
-                if nested_tokens:
-                    current_obj: Optional[dict] = obj
-                    for nested_token in nested_tokens:
-                        if (
-                            isinstance(current_obj, dict)
-                            and nested_token in current_obj
-                        ):
-                            current_obj = current_obj[nested_token]
-                        else:
-                            current_obj = None
-                            break
-                    if current_obj is not None:
-                        if isinstance(current_obj, (str, int, float, bool)):
-                            results.append(str(current_obj))
-                        elif isinstance(current_obj, (list, dict)):
-                            results.append(json.dumps(current_obj, sort_keys=True))
-
-        # Handle wildcard
-        elif token == "*":
-            if isinstance(obj, dict):
-                for value in obj.values():
-                    results.extend(_extract_from_obj(value, tokens, pos + 1))
-            elif isinstance(obj, list):
-                for item in obj:
-                    results.extend(_extract_from_obj(item, tokens, pos + 1))
-
-        # Handle regular field
-        else:
-            if isinstance(obj, dict) and token in obj:
-                results.extend(_extract_from_obj(obj[token], tokens, pos + 1))
-
-        return results
-
-    return _extract_from_obj(obj, tokens, 0)
+# Private utility functions
 
 
-# Private utility functions
+# Bracketed segments may not nest their own bracket type. A bare "[" or "{" token
+# means the path has unbalanced or nested brackets, which the scanner handles.
+_PATH_TOKEN_RE = re.compile(r"\[[^\[\]]*\]|\{[^{}]*\}|[^.\[{]+|[\[{]")
 
 
 def tokenize_path(path: str) -> list[str]:
@@ -298,7 +233,14 @@ def tokenize_path(path: str) -> list[str]:
     """
     if not path:
         return []
+    tokens = _PATH_TOKEN_RE.findall(path)
+    if "[" in tokens or "{" in tokens:
+        return _scan_path(path)
+    return tokens
 
+
+def _scan_path(path: str) -> list[str]:
+    """Tokenize a path with nested or unbalanced brackets character by character."""
     tokens = []
     current: list[str] = []
     i = 0
@@ -353,6 +295,151 @@ def tokenize_path(path: str) -> list[str]:
     return tokens
 
 
+# Opcodes of a compiled path; each step is an (opcode, argument) pair
+_FIELDS = "fields"
+_INDEX = "index"
+_INDEX_ALL = "index_all"
+_WILDCARD = "wildcard"
+_MULTI = "multi"
+_NOTHING = "nothing"
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_path(path: str) -> tuple[tuple[str, Any], ...]:
+    """Tokenize and compile a path string, once per distinct path."""
+    return _compile_tokens(tuple(tokenize_path(path)))
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_tokens(tokens: tuple[str, ...]) -> tuple[tuple[str, Any], ...]:
+    """Compile path tokens into (opcode, argument) steps for get_text_at_path.
+
+    Array indices are parsed and multi-field selections are split and tokenized
+    here, so extracting text from a document never re-parses the path.
+    """
+    ops: list[tuple[str, Any]] = []
+    for token in tokens:
+        if token.startswith("[") and token.endswith("]"):
+            index = token[1:-1]
+            if index == "*":
+                ops.append((_INDEX_ALL, None))
+            else:
+                try:
+                    ops.append((_INDEX, int(index)))
+                except ValueError:
+                    ops.append((_NOTHING, None))
+        elif token.startswith("{") and token.endswith("}"):
+            fields = [f.strip() for f in token[1:-1].split(",")]
+            nested = tuple(tuple(tokenize_path(field)) for field in fields)
+            ops.append((_MULTI, tuple(tokens for tokens in nested if tokens)))
+        elif token == "*":
+            ops.append((_WILDCARD, None))
+        else:
+            if ops and ops[-1][0] == _FIELDS:
+                # consecutive keys are looked up in one step
+                ops[-1] = (_FIELDS, ops[-1][1] + (token,))
+            else:
+                ops.append((_FIELDS, (token,)))
+    return tuple(ops)
+
+
+def _extract_from_obj(root: Any, ops: tuple[tuple[str, Any], ...]) -> list[str]:
+    """Walk a compiled path through an object and collect the text it selects.
+
+    Uses an explicit stack rather than recursion. Children are pushed in reverse
+    so results come out in document order, and children at the end of the path
+    are converted to text directly instead of going through the stack.
+    """
+    results: list[str] = []
+    if not ops:
+        _append_leaf_text(root, results)
+        return results
+    if len(ops) == 1 and ops[0][0] == _FIELDS:
+        # plain dotted path such as "metadata.title"; no walking needed
+        _append_leaf_text(_lookup_fields(root, ops[0][1]), results)
+        return results
+
+    # wildcards and multi-field selections can reach the same sub-object more
+    # than once, so containers are serialized at most once per call
+    dumped: dict[int, str] = {}
+    last = len(ops)
+    stack: list[tuple[Any, int]] = [(root, 0)]
+    while stack:
+        obj, pos = stack.pop()
+        op, arg = ops[pos]
+        pos += 1
+
+        children: Reversible[Any]
+        if op == _FIELDS:
+            obj = _lookup_fields(obj, arg)
+            children = () if obj is None else (obj,)
+        elif op == _INDEX:
+            if isinstance(obj, list) and -len(obj) <= arg < len(obj):
+                children = (obj[arg],)
+            else:
+                children = ()
+        elif op == _INDEX_ALL:
+            children = obj if isinstance(obj, list) else ()
+        elif op == _WILDCARD:
+            if isinstance(obj, dict):
+                children = obj.values()
+            elif isinstance(obj, list):
+                children = obj
+            else:
+                children = ()
+        elif op == _MULTI:
+            if isinstance(obj, dict):
+                for nested_tokens in arg:
+                    _append_leaf_text(
+                        _lookup_fields(obj, nested_tokens), results, dumped
+                    )
+            continue
+        else:  # _NOTHING (an unparseable index) never matches
+            continue
+
+        if pos == last:
+            for child in children:
+                _append_leaf_text(child, results, dumped)
+        else:
+            for child in reversed(children):
+                stack.append((child, pos))
+
+    return results
+
+
+def _lookup_fields(obj: Any, keys: tuple[str, ...]) -> Any:
+    """Follow dict keys from obj, returning None if any of them is missing."""
+    for key in keys:
+        if isinstance(obj, dict) and key in obj:
+            obj = obj[key]
+        else:
+            return None
+    return obj
+
+
+def _append_leaf_text(
+    obj: Any, results: list[str], dumped: Optional[dict[int, str]] = None
+) -> None:
+    if type(obj) is str:
+        # text fields are the common case and need no conversion
+        results.append(obj)
+    elif isinstance(obj, (str, int, float, bool)):
+        results.append(str(obj))
+    elif isinstance(obj, (list, dict)):
+        if dumped is None:
+            results.append(_dumps_sorted(obj))
+            return
+        text = dumped.get(id(obj))
+        if text is None:
+            text = dumped[id(obj)] = _dumps_sorted(obj)
+        results.append(text)
+
+
+# Same output as json.dumps(obj, sort_keys=True), without building a new
+# encoder on every call
+_dumps_sorted = json.JSONEncoder(sort_keys=True).encode
+
+
 def _is_async_callable(
     func: Any,
 ) -> bool:
@@ -15,6 +15,7 @@ from langgraph.store.base import (
     PutOp,
     Result,
     get_text_at_path,
+    tokenize_path,
 )
 from langgraph.store.base.batch import AsyncBatchedBaseStore
 from langgraph.store.memory import InMemoryStore
@@ -101,6 +102,22 @@ def test_get_text_at_path() -> None:
     assert get_text_at_path(nested_data, "nested[{invalid}]") == []
 
 
+def test_tokenize_path() -> None:
+    assert tokenize_path("") == []
+    assert tokenize_path("a.b..c") == ["a", "b", "c"]
+    assert tokenize_path("items[*].{id,nested.value}") == [
+        "items",
+        "[*]",
+        "{id,nested.value}",
+    ]
+    assert tokenize_path("a[0][-1]b") == ["a", "[0]", "[-1]", "b"]
+    # Nested and unbalanced brackets keep the scanner's behavior
+    assert tokenize_path("a[[0]].b") == ["a", "[[0]]", "b"]
+    assert tokenize_path("{a,{b}}.c") == ["{a,{b}}", "c"]
+    assert tokenize_path("a.{unclosed") == ["a", "{unclosed"]
+    assert tokenize_path("a[0.b") == ["a", "[0.b"]
+
+
 async def test_async_batch_store(mocker: MockerFixture) -> None:
     abatch = mocker.stub()
 